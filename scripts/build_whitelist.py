@@ -1,11 +1,37 @@
 import os
+import re
 import json
+import hashlib
 import pandas as pd
 from typing import Set
 from functools import lru_cache
 
 from clean_eeg.paths import DATA_DIR, AUTO_WORD_WHITELIST_PATH
 
+# Only these SUBTLEX-US columns are used; everything else in the sheet
+# (PoS tags, Zipf values, ...) is dropped at read time.
+SUBTLEX_COLUMNS = ["Word", "FREQcount", "Lg10WF"]
+SUBTLEX_WORD_RE = re.compile(r"^[^\W\d_]+(?:[-'’][^\W\d_]+)*$")
+POSSESSIVE_SUFFIX_RE = re.compile(r"(?:['’]s)$")
+
+
+def read_subtlex_table(path: str) -> pd.DataFrame:
+    """
+    Read the SUBTLEX-US spreadsheet through a CSV sidecar cache.
+
+    Parsing the ~74k-row xlsx with openpyxl takes tens of seconds; the
+    sidecar (``<name>.cache.csv`` next to the xlsx) holds just the
+    columns in SUBTLEX_COLUMNS and loads in milliseconds. The cache is
+    rebuilt whenever the xlsx is newer than it.
+    """
+    cache_path = os.path.splitext(path)[0] + ".cache.csv"
+    if (os.path.exists(cache_path)
+            and os.path.getmtime(cache_path) >= os.path.getmtime(path)):
+        return pd.read_csv(cache_path)
+    df = pd.read_excel(path, usecols=lambda c: c in SUBTLEX_COLUMNS)
+    df.to_csv(cache_path, index=False)
+    return df
+
 
 @lru_cache(maxsize=10)
 def load_subtletitlex_whitelist(path: str, top_n: int = 20000) -> Set[str]:
@@ -22,7 +48,7 @@ def load_subtletitlex_whitelist(path: str, top_n: int = 20000) -> Set[str]:
     downloaded from https://osf.io/7wx25 on 2025-08-21
 
     """
-    df = pd.read_excel(path)
+    df = read_subtlex_table(path)
 
     # Pick a sort key that exists in your file
     sort_cols = [c for c in ["FREQcount", "Lg10WF"] if c in df.columns]
@@ -36,19 +62,12 @@ def load_subtletitlex_whitelist(path: str, top_n: int = 20000) -> Set[str]:
     if "Word" not in df.columns:
         raise ValueError("Could not find a 'Word' column.")
 
-    words = []
-    import re
-    pat = re.compile(r"^[^\W\d_]+(?:[-'’][^\W\d_]+)*$")
-    for w in df_sorted["Word"].astype(str).head(top_n):
-        w = w.strip()
-        if not w:
-            continue
-        # Keep alphabetic tokens with optional internal ' or -
-        if pat.match(w):
-            words.append(w.casefold())
+    words = df_sorted["Word"].astype(str).head(top_n).str.strip()
+    # Keep alphabetic tokens with optional internal ' or -
+    words = words[words.str.match(SUBTLEX_WORD_RE)].str.casefold()
 
     # Remove possessive "'s" and bare "'"
-    wl = {re.sub(r"(?:['’]s)$", "", w) for w in words}
+    wl = set(words.str.replace(POSSESSIVE_SUFFIX_RE, "", regex=True))
     return wl
 
 
@@ -56,6 +75,7 @@ NAME_LIST_PATH = os.path.join(DATA_DIR, 'name_list.json')
 
 @lru_cache(maxsize=10)
 def load_names(dataset_name: str = 'name_dataset') -> Set[str]:
+    """Casefolded name set from the given dataset."""
     if dataset_name == 'nicknames':
         all_names = load_nicknames_dataset_names()
     elif dataset_name == 'name_dataset':
@@ -71,49 +91,93 @@ def load_nicknames_dataset_names() -> Set[str]:
     with with_names_csv_path() as f:
         print("Loading nicknames from:", f)
         names = pd.read_csv(f)
-    all_names = set(list(names["name1"].unique()) + list(names["name2"].unique()))
-    return all_names
+    all_names = set(names["name1"]) | set(names["name2"])
+    return {n.casefold() for n in all_names if isinstance(n, str)}
 
 
 NAME_DATA_PATH = DATA_DIR / 'name_dataset' / 'data'
 
+def name_dataset_paths(countries=('US',)) -> list[str]:
+    """Per-country CSV files of the name dataset, in a stable order."""
+    return sorted(
+        os.path.join(NAME_DATA_PATH, name_path)
+        for name_path in os.listdir(NAME_DATA_PATH)
+        if os.path.splitext(name_path)[0] in countries
+        and os.path.splitext(name_path)[1] == '.csv'
+    )
+
+
 @lru_cache(maxsize=10)
-def load_names_dataset_names(countries=['US']) -> Set[str]:
+def load_names_dataset_names(countries=('US',)) -> Set[str]:
     # https://github.com/philipperemy/name-dataset
     print('Building name list from:', NAME_DATA_PATH)
-    # load names from CSV files in the name dataset
-    names_df = list()
-    for name_path in os.listdir(NAME_DATA_PATH):
-        if os.path.splitext(name_path)[0] not in countries:
-            continue
-        if os.path.splitext(name_path)[1] != '.csv':
-            continue
-        path = os.path.join(NAME_DATA_PATH, name_path)
-        df = pd.read_csv(path, names=["FirstName", "LastName", 'Gender', 'Country'])
-        names_df.append(df)
-    names_df = pd.concat(names_df, ignore_index=True)
-    all_names = set(list(names_df["FirstName"].unique()) + list(names_df["LastName"].unique()))
-    return all_names
-    
+    # stream the name columns of each country CSV straight into one set;
+    # the Gender/Country columns are never parsed
+    all_names = set()
+    for path in name_dataset_paths(countries):
+        df = pd.read_csv(path, names=["FirstName", "LastName", 'Gender', 'Country'],
+                         usecols=["FirstName", "LastName"], dtype=str)
+        all_names.update(df["FirstName"].array)
+        all_names.update(df["LastName"].array)
+    # casefold here (matching the SUBTLEX words) so callers can diff sets directly
+    return {n.casefold() for n in all_names if isinstance(n, str)}
 
-if __name__ == "__main__":
+
+SUBTLEX_PATH = os.path.join(DATA_DIR, 'SUBTLEX-US_frequency_list_PoS_Zipf.xlsx')
+SUBTLEX_TOP_N = 50000
+# sidecar recording which inputs the saved whitelist was built from
+AUTO_WORD_WHITELIST_KEY_PATH = f"{AUTO_WORD_WHITELIST_PATH}.key"
+
+
+def whitelist_inputs_key(paths: list[str], top_n: int) -> str:
+    """
+    Fingerprint of the whitelist build inputs: (path, mtime, size) of
+    every input file plus the build parameters. Cheap (stat only) and
+    changes whenever an input file is replaced or edited.
+    """
+    stats = [(str(p), os.stat(p).st_mtime_ns, os.stat(p).st_size) for p in paths]
+    return hashlib.blake2b(repr((stats, top_n)).encode()).hexdigest()
+
+
+def write_text_atomic(path, text: str) -> None:
+    """Write via a temp file + os.replace so readers never see a partial file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def main() -> int:
     # build white list of words
+    input_paths = [SUBTLEX_PATH, *name_dataset_paths()]
+    key = whitelist_inputs_key(input_paths, top_n=SUBTLEX_TOP_N)
+    if (os.path.exists(AUTO_WORD_WHITELIST_PATH)
+            and os.path.exists(AUTO_WORD_WHITELIST_KEY_PATH)):
+        with open(AUTO_WORD_WHITELIST_KEY_PATH, 'r', encoding='utf-8') as f:
+            if f.read().strip() == key:
+                print('Whitelist inputs unchanged; keeping existing whitelist at:',
+                      AUTO_WORD_WHITELIST_PATH)
+                return 0
 
     # build base white list of common words from SUBTITLEX-US corpus (Brysbaert & New, 2008)
-    path = os.path.join(DATA_DIR, 'SUBTLEX-US_frequency_list_PoS_Zipf.xlsx')
-    print('Building base white list from SUBTITLEX-US dataset from:', path)
-    subtitlex_wl = load_subtletitlex_whitelist(path, top_n=50000)
+    print('Building base white list from SUBTITLEX-US dataset from:', SUBTLEX_PATH)
+    subtitlex_wl = load_subtletitlex_whitelist(SUBTLEX_PATH, top_n=SUBTLEX_TOP_N)
 
     all_names = load_names('name_dataset')
 
-    all_names = filter(lambda x: isinstance(x, str), all_names)
-    all_names = set(map(str.lower, all_names))
-    
     wl = subtitlex_wl - all_names
     print('Words before filtering:', len(subtitlex_wl))
     print('Names filtered:', len(all_names))
     print('Final whitelist size:', len(wl))
 
-    with open(AUTO_WORD_WHITELIST_PATH, 'w') as f:
-        json.dump(list(wl), f)
-        print('Saved automatically generated whitelist to:', AUTO_WORD_WHITELIST_PATH)
+    # sorted for deterministic output / reviewable diffs between builds
+    write_text_atomic(AUTO_WORD_WHITELIST_PATH,
+                      json.dumps(sorted(wl), ensure_ascii=False, separators=(',', ':')))
+    # key last: an interrupted run leaves a stale key, forcing a rebuild
+    write_text_atomic(AUTO_WORD_WHITELIST_KEY_PATH, key)
+    print('Saved automatically generated whitelist to:', AUTO_WORD_WHITELIST_PATH)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
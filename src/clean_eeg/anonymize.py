@@ -1,14 +1,18 @@
 import re
-from typing import List, Set
+import numpy as np
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Set, Tuple
 
 from presidio_analyzer import (
     AnalyzerEngine, RecognizerRegistry, PatternRecognizer, Pattern,
     EntityRecognizer, RecognizerResult
 )
-from presidio_analyzer.nlp_engine import NlpEngineProvider
+from presidio_analyzer.nlp_engine import NlpArtifacts, NlpEngineProvider
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.entities import OperatorConfig
 from rapidfuzz.distance import Levenshtein
+from rapidfuzz.process import cdist
 from nicknames import NickNamer
 
 REDACT_NAME_REPLACEMENT = "X"
@@ -31,9 +35,14 @@ def normalize_name_token(name: str) -> str:
     return name
 
 
+# token with optional possessive; preserve internal punctuation
+FUZZY_TOKEN_RE = re.compile(r"\b([A-Za-z]+(?:['’-][A-Za-z]+)*)(?:['’]s)?\b")
+_NAME_PUNCT_TABLE = str.maketrans("", "", "'’-")
+
+
 def strip_punct(s: str) -> str:
     """Remove apostrophes/hyphens for normalization."""
-    return re.sub(r"['’-]", "", s)
+    return s.translate(_NAME_PUNCT_TABLE)
 
 
 def make_token_regex_allow_optional_punct(token: str) -> str:
@@ -42,48 +51,100 @@ def make_token_regex_allow_optional_punct(token: str) -> str:
     - "O'Connor" -> r"O['’-]?Connor"
     - "Smith-Jones" -> r"Smith['’-]?Jones"
     """
-    parts = re.split(r"(['’-])", token)
-    out = []
-    i = 0
-    while i < len(parts):
-        p = parts[i]
-        if p in ("'", "’", "-"):
-            # make the separator optional
-            out.append(r"['’-]?")
-        else:
-            out.append(re.escape(p))
-        i += 1
-    return "".join(out)
-
-def build_deny_variants(tokens: List[str]) -> Set[str]:
+    return "".join(r"['’-]?" if ch in "'’-" else re.escape(ch) for ch in token)
+
+def build_deny_variants(tokens: List[str]) -> FrozenSet[str]:
     """
-    Exact-match variants (case-insensitive), plus punctuation-dropped mirrors:
+    Exact-match variants, casefolded (matching is case-insensitive), plus
+    punctuation-dropped mirrors:
       - full name; first+last; each token alone
       - possessives on all variants
       - versions with apostrophes/hyphens removed
     """
     variants: Set[str] = set(tokens)
-
     if tokens:
         variants.add(" ".join(tokens))
     if len(tokens) >= 2:
         variants.add(f"{tokens[0]} {tokens[-1]}")
 
     # punctuation-dropped mirrors
-    more = set()
-    for v in list(variants):
-        vv = strip_punct(v)
-        if vv and vv != v:
-            more.add(vv)
-    variants |= more
+    variants |= {vv for vv in map(strip_punct, variants) if vv}
 
     # possessives
-    variants |= {v + "'s" for v in list(variants)}
-    variants |= {v + "’s" for v in list(variants)}
-    return variants
+    return frozenset(v.casefold()
+                     for base in variants
+                     for v in (base, base + "'s", base + "’s"))
+
+
+def trie_regex(words: Set[str]) -> str:
+    """
+    Alternation regex for ``words`` with shared prefixes factored out, e.g.
+    {"john", "john's", "jon"} -> r"jo(?:hn(?:'s)?|n)". The regex engine
+    walks the trie once per start position instead of retrying every
+    alternative, and the greedy optional groups prefer the longest word.
+    """
+    trie: dict = {}
+    for w in words:
+        node = trie
+        for c in w:
+            node = node.setdefault(c, {})
+        node[""] = {}  # end-of-word marker
+
+    def to_regex(node: dict) -> str:
+        is_end = "" in node
+        branches = [re.escape(c) + to_regex(child)
+                    for c, child in sorted(node.items()) if c]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if is_end:
+            body = (body if len(branches) > 1 else "(?:" + body + ")") + "?"
+        return body
+
+    return to_regex(trie)
+
+
+class DenyListRecognizer(EntityRecognizer):
+    """
+    Case-insensitive exact matcher for the subject's deny-list variants.
+
+    Same boundaries and score as ``PatternRecognizer(deny_list=...)``, but
+    the variants (nicknames x possessives x punctuation mirrors, often
+    hundreds) are compiled into a prefix-trie regex rather than a flat
+    alternation, so each position in the text is scanned once.
+    """
+    def __init__(self, deny_list: Iterable[str], score: float = 1.0):
+        super().__init__(supported_entities=["SUBJECT_NAME"], supported_language="en",
+                         name="subject_name_denylist")
+        self.score = score
+        words = {w.casefold() for w in deny_list if w}
+        self.regex = (re.compile(r"(?<!\w)(?:" + trie_regex(words) + r")(?!\w)",
+                                 re.IGNORECASE) if words else None)
+
+    def load(self):  # no-op
+        pass
+
+    def analyze(self, text, entities, nlp_artifacts=None):
+        if "SUBJECT_NAME" not in entities:
+            return []
+        return self.match(text)
+
+    def match(self, text: str) -> List[RecognizerResult]:
+        if self.regex is None:
+            return []
+        return [RecognizerResult("SUBJECT_NAME", m.start(), m.end(), self.score)
+                for m in self.regex.finditer(text)]
+
+
+def _lengths_within_one(tokens: List[str]) -> frozenset:
+    """All string lengths within one edit (insert/delete) of some token."""
+    return frozenset(len(t) + d for t in tokens for d in (-1, 0, 1))
 
 
 class FuzzySubjectNameRecognizer(EntityRecognizer):
+    # bound on the per-recognizer token-score memo (cleared when exceeded)
+    _MAX_SCORED_TOKENS = 1 << 16
+
     def __init__(self,
                  subject_tokens: List[str],
                  min_detection_token_length: int = 3):
@@ -91,38 +152,114 @@ class FuzzySubjectNameRecognizer(EntityRecognizer):
         self.min_detection_token_length = min_detection_token_length
         # store both original and punctuation-stripped forms
         self.targets_raw = [t for t in subject_tokens if len(t) >= self.min_detection_token_length]
-        self.targets_norm = [strip_punct(t).lower() for t in self.targets_raw]
+        self.targets_raw_lower = tuple(t.lower() for t in self.targets_raw)
+        self.targets_norm = tuple(strip_punct(t) for t in self.targets_raw_lower)
+        # A token can only be within one edit of a target whose length is
+        # within one of its own; anything else is dropped before scoring.
+        self._raw_lengths = _lengths_within_one(self.targets_raw_lower)
+        self._norm_lengths = _lengths_within_one(self.targets_norm)
+        # lowercased token -> score (0.0 = no match), shared across texts
+        self._token_scores: dict = {}
 
     def load(self):  # no-op
         pass
 
     def analyze(self, text, entities, nlp_artifacts=None):
-        if "SUBJECT_NAME" not in entities or not self.targets_raw:
+        if "SUBJECT_NAME" not in entities:
+            return []
+        return self.match(text)
+
+    def match(self, text: str, covered: bytearray = None) -> List[RecognizerResult]:
+        """Fuzzy hits in ``text``. Tokens lying entirely on positions set
+        in ``covered`` (already matched by another recognizer) are skipped."""
+        if not self.targets_raw:
             return []
 
-        results = []
-        # token with optional possessive; preserve internal punctuation
-        pattern = r"\b([A-Za-z]+(?:['’-][A-Za-z]+)*)(?:['’]s)?\b"
-        for token_match in re.finditer(pattern, text):
-            token = token_match.group(1)
+        # Each distinct token is scored once per recognizer, not once per
+        # text: annotations are built from a small vocabulary ("Event",
+        # "patient", "sleeping", ...), so after the first few texts nearly
+        # every token is a known non-match and no cdist call is needed.
+        scores = self._token_scores
+        if len(scores) > self._MAX_SCORED_TOKENS:
+            scores.clear()
+        hits = []
+        unscored = {}
+        for m in FUZZY_TOKEN_RE.finditer(text):
+            token = m.group(1)
             if len(token) < self.min_detection_token_length:
                 continue
+            if covered is not None and covered[m.start()] and covered[m.end() - 1]:
+                continue
             token_lower = token.lower()
-            token_norm = strip_punct(token_lower)
-
-            # Compare both raw and normalized (punct dropped) forms
-            matched = False
-
-            for tgt_raw, tgt_norm in zip(self.targets_raw, self.targets_norm):
-                if (Levenshtein.distance(token_lower, tgt_raw.lower()) <= 1 or
-                    Levenshtein.distance(token_norm, tgt_norm) <= 1):
-                    score = 1.0 if (token_lower == tgt_raw.lower() or token_norm == tgt_norm) else 0.9
-                    results.append(RecognizerResult("SUBJECT_NAME", token_match.start(), token_match.end(), score))
-                    matched = True
-                    break
-            if matched:
+            score = scores.get(token_lower)
+            if score is None:
+                if token_lower not in unscored:
+                    token_norm = strip_punct(token_lower)
+                    if (len(token_lower) not in self._raw_lengths
+                            and len(token_norm) not in self._norm_lengths):
+                        scores[token_lower] = 0.0
+                        continue
+                    unscored[token_lower] = token_norm
+            elif not score:
                 continue
-        return results
+            hits.append((m.start(), m.end(), token_lower))
+        if unscored:
+            self._score_tokens(unscored)
+        return [RecognizerResult("SUBJECT_NAME", start, end, scores[token_lower])
+                for start, end, token_lower in hits if scores[token_lower]]
+
+    def _score_tokens(self, tokens: dict) -> None:
+        """Score ``tokens`` (lowercased -> punctuation-stripped) against the
+        targets and record them in ``_token_scores``."""
+        tokens_lower = list(tokens)
+        tokens_norm = list(tokens.values())
+        # Compare both raw and normalized (punct dropped) forms. One cdist
+        # call per form scores every token x target pair in rapidfuzz's C++
+        # loop; score_cutoff=1 caps each distance at 2 (= "no match").
+        dist_raw = cdist(tokens_lower, self.targets_raw_lower,
+                         scorer=Levenshtein.distance, score_cutoff=1)
+        dist_norm = cdist(tokens_norm, self.targets_norm,
+                          scorer=Levenshtein.distance, score_cutoff=1)
+        hits = (dist_raw <= 1) | (dist_norm <= 1)
+
+        # per distinct token: score of its first matching target, as before
+        first = hits.argmax(axis=1)
+        idx = np.arange(len(first))
+        exact = (dist_raw[idx, first] == 0) | (dist_norm[idx, first] == 0)
+        row_scores = np.where(hits.any(axis=1), np.where(exact, 1.0, 0.9), 0.0).tolist()
+        self._token_scores.update(zip(tokens_lower, row_scores))
+
+
+class CombinedSubjectRecognizer(EntityRecognizer):
+    """
+    Deny-list and fuzzy subject-name matching behind a single recognizer.
+
+    Runs the exact deny-list scan first, then the fuzzy scan only over
+    tokens the deny list didn't already cover, so exact hits (the common
+    case) are never re-scored. One registry entry instead of two also
+    saves a round of analyzer dispatch per text.
+    """
+    def __init__(self, deny_list: Iterable[str], subject_tokens: List[str]):
+        super().__init__(supported_entities=["SUBJECT_NAME"], supported_language="en",
+                         name="subject_name_combined")
+        self.deny = DenyListRecognizer(deny_list)
+        self.fuzzy = FuzzySubjectNameRecognizer(subject_tokens)
+
+    def load(self):  # no-op
+        pass
+
+    def analyze(self, text, entities, nlp_artifacts=None):
+        if "SUBJECT_NAME" not in entities:
+            return []
+        results = self.deny.match(text)
+        if not self.fuzzy.targets_raw:
+            return results
+        covered = None
+        if results:
+            covered = bytearray(len(text))
+            for r in results:
+                covered[r.start:r.end] = b"\x01" * (r.end - r.start)
+        return results + self.fuzzy.match(text, covered)
 
 
 def _initial_letter(name_token: str) -> str:
@@ -231,29 +368,35 @@ def build_title_name_pattern(first_name_token: str, last_name_token: str,
     return "(?:" + "|".join(branches) + ")"
 
 
-class PersonalName():
-    def __init__(self,
-                 first_name: str,
-                 middle_names: List[str],
-                 last_name: str):
-        self.first_name = first_name
-        self.last_name = last_name
-        self.middle_names = middle_names
+@dataclass(frozen=True, slots=True)
+class PersonalName:
+    """Subject name. Frozen (and so hashable) so per-name work can be
+    cached; ``middle_names`` is stored as a tuple, lists are accepted."""
+    first_name: str
+    middle_names: Tuple[str, ...] = ()
+    last_name: str = ""
+
+    def __post_init__(self):
+        object.__setattr__(self, "middle_names", tuple(self.middle_names))
 
     def get_full_name(self) -> str:
         """
         Get the full name as a string.
         """
-        names = [self.first_name] + self.middle_names + [self.last_name]
-        return " ".join(names).strip()
-    
+        return " ".join((self.first_name, *self.middle_names, self.last_name)).strip()
+
     def get_normalized_tokens(self) -> List[str]:
         """
         Get the normalized tokens of the full name.
         """
-        return [normalize_name_token(self.first_name),
-               *[normalize_name_token(m) for m in self.middle_names],
-               normalize_name_token(self.last_name)]
+        return list(_normalized_tokens(self))
+
+
+@lru_cache(maxsize=None)
+def _normalized_tokens(name: PersonalName) -> Tuple[str, ...]:
+    return (normalize_name_token(name.first_name),
+            *(normalize_name_token(m) for m in name.middle_names),
+            normalize_name_token(name.last_name))
 
 
 class TitleAndInitialsRecognizer(PatternRecognizer):
@@ -272,15 +415,47 @@ class TitleAndInitialsRecognizer(PatternRecognizer):
         )
         patterns = [Pattern(name="title_first_midinit_last", regex=pat, score=0.9)] if pat else []
         super().__init__(supported_entity="SUBJECT_NAME", name="subject_title_initials", patterns=patterns)
+        # Every branch of the pattern contains the last name (with its
+        # punctuation optional), so a text whose punctuation-stripped,
+        # lowercased form lacks it can't match; a substring test rules
+        # that out far faster than running the regex.
+        self._required_literal = strip_punct(normalize_name_token(name.last_name)).lower()
+
+    def analyze(self, text, entities, nlp_artifacts=None, regex_flags=None):
+        if self._required_literal and self._required_literal not in strip_punct(text).lower():
+            return []
+        return super().analyze(text, entities, nlp_artifacts, regex_flags)
 
 
 # ---------- build & run ----------
-def build_presidio():
+@lru_cache(maxsize=1)
+def _get_nlp_engine():
+    """spaCy NLP engine, loaded once per process (the model load is the
+    bulk of the Presidio setup cost)."""
     nlp_conf = {"nlp_engine_name": "spacy",
                 "models": [{"lang_code": "en", "model_name": "en_core_web_sm"}]}
-    nlp_engine = NlpEngineProvider(nlp_configuration=nlp_conf).create_engine()
+    return NlpEngineProvider(nlp_configuration=nlp_conf).create_engine()
+
+
+@lru_cache(maxsize=1)
+def _get_anonymizer() -> AnonymizerEngine:
+    return AnonymizerEngine()
+
+
+@lru_cache(maxsize=1)
+def _empty_nlp_artifacts() -> NlpArtifacts:
+    """NlpArtifacts with no tokens/entities. Handed to the analyzer in
+    place of a spaCy parse when no recognizer needs one."""
+    return NlpArtifacts(entities=[], tokens=[], tokens_indices=[], lemmas=[],
+                        nlp_engine=_get_nlp_engine(), language="en")
+
+
+def build_presidio():
+    # The NLP engine and anonymizer hold no subject state and are shared;
+    # each caller gets its own registry for its subject-specific recognizers.
     registry = RecognizerRegistry()
-    return AnalyzerEngine(nlp_engine=nlp_engine, registry=registry), AnonymizerEngine(), registry
+    analyzer = AnalyzerEngine(nlp_engine=_get_nlp_engine(), registry=registry)
+    return analyzer, _get_anonymizer(), registry
 
 def _alpha_len(token: str) -> int:
     """Number of alphabetic characters in ``token`` (ignores apostrophes,
@@ -303,34 +478,52 @@ def add_subject_name_detectors(registry: RecognizerRegistry,
     for mn in name.middle_names:
         if _alpha_len(mn) >= 2:
             nicknames |= get_name_variants(mn, levels=2)
-    tokens.extend(nicknames)
+    tokens.extend(n for n in nicknames if n)
 
     # 1) exact matches + punctuation-dropped mirrors (incl. possessives)
-    deny_variants = list(build_deny_variants(tokens))
-    registry.add_recognizer(PatternRecognizer(
-        supported_entity="SUBJECT_NAME",
-        deny_list=deny_variants,
-        name="subject_name_denylist",
-    ))
+    # 2) fuzzy token matcher (len >= min_detection_token_length), Levenshtein <= 1
+    #    on raw and punctuation-dropped, over tokens the deny list didn't match
+    # Recognizers that could never match are not registered at all, so the
+    # analyzer doesn't pay per-recognizer dispatch for them on every text.
+    if tokens:
+        registry.add_recognizer(CombinedSubjectRecognizer(build_deny_variants(tokens), tokens))
+
+    # 3) title + initials + last (regex) to eat "Dr." and middle initials in span;
+    #    every branch is anchored on the last name, so skip it without one
+    if _alpha_len(name.last_name) > 0:
+        registry.add_recognizer(TitleAndInitialsRecognizer(name))
 
-    # 2) title + initials + last (regex) to eat "Dr." and middle initials in span
-    registry.add_recognizer(TitleAndInitialsRecognizer(name))
 
-    # 3) fuzzy token matcher (len >= min_detection_token_length), Levenshtein <= 1 on raw and punctuation-dropped
-    registry.add_recognizer(FuzzySubjectNameRecognizer(tokens))
+@lru_cache(maxsize=1)
+def _get_nicknamer() -> NickNamer:
+    # NickNamer parses its bundled CSV on construction
+    return NickNamer()
 
 
 def get_name_variants(name: str, levels=1) -> set[str]:
     assert isinstance(levels, int) and levels > 0
-    nicknamer = NickNamer()
+    nicknamer = _get_nicknamer()
     variants = {name}
-    # iterate multiple levels since nicknames and canonicals can have their own variants
+    frontier = {name}
+    # iterate multiple levels since nicknames and canonicals can have their own
+    # variants; only names first reached at the previous level need expanding
     for _ in range(levels):
-        for variant in variants.copy():
-            variants |= nicknamer.nicknames_of(variant) | nicknamer.canonicals_of(variant)
+        next_frontier = set()
+        for variant in frontier:
+            next_frontier |= nicknamer.nicknames_of(variant) | nicknamer.canonicals_of(variant)
+        frontier = next_frontier - variants
+        if not frontier:
+            break
+        variants |= frontier
     return variants
 
 
+# Recognizers in this module whose analyze() ignores nlp_artifacts
+# (TitleAndInitialsRecognizer is a PatternRecognizer).
+_NLP_FREE_RECOGNIZERS = (DenyListRecognizer, FuzzySubjectNameRecognizer,
+                         CombinedSubjectRecognizer, PatternRecognizer)
+
+
 class SubjectNameRedactor:
     """Pre-built Presidio engines plus subject-specific recognizers.
 
@@ -347,8 +540,9 @@ class SubjectNameRedactor:
     signal-header fields (every channel has ``dimension="uV"``,
     ``transducer=""``, ``prefilter=""``, ...) and often-repeated
     annotation texts, so the cache hit rate on real NK files is usually
-    95%+.
+    95%+. The memo is bounded by ``_MAX_CACHED_TEXTS`` entries.
     """
+    _MAX_CACHED_TEXTS = 1 << 16
 
     def __init__(self, subject_full_name: "PersonalName",
                  replacement: str = REDACT_NAME_REPLACEMENT):
@@ -356,16 +550,67 @@ class SubjectNameRedactor:
         self.replacement = replacement
         self.analyzer, self.anonymizer, self.registry = build_presidio()
         add_subject_name_detectors(self.registry, subject_full_name)
+        subject_recognizers = [r for r in self.registry.recognizers
+                               if "SUBJECT_NAME" in r.supported_entities]
+        self._has_recognizers = bool(subject_recognizers)
+        # The subject-name recognizers match on the raw text and declare no
+        # context words, so the spaCy parse Presidio would run per text is
+        # never read. Skip it (the dominant per-text cost with a full model)
+        # unless a recognizer that could use it has been registered.
+        self._needs_nlp = any(r.context or not isinstance(r, _NLP_FREE_RECOGNIZERS)
+                              for r in subject_recognizers)
         self._operators = {"SUBJECT_NAME": OperatorConfig(
             "replace", {"new_value": replacement})}
         self._cache: dict = {}
 
+    @property
+    def needs_nlp(self) -> bool:
+        """Whether redaction runs the spaCy parse, i.e. whether batching
+        texts through ``redact_many`` (``nlp.pipe``) pays off."""
+        return self._needs_nlp
+
     def redact(self, text: str) -> str:
         cached = self._cache.get(text)
         if cached is not None:
             return cached
+        return self._redact_uncached(text)
+
+    def redact_many(self, texts: Iterable[str], batch_size: int = 64) -> List[str]:
+        """Redact ``texts``. When a registered recognizer needs the spaCy
+        parse, the distinct uncached texts are parsed in batches
+        (``nlp.pipe``) instead of one document at a time."""
+        texts = list(texts)
+        if not self._needs_nlp:
+            return [self.redact(t) for t in texts]
+        # collected locally: the bounded cache may be reset mid-batch
+        redacted = {t: self._cache[t] for t in dict.fromkeys(texts) if t in self._cache}
+        misses = [t for t in dict.fromkeys(texts) if t not in redacted]
+        if misses:
+            batch = self.analyzer.nlp_engine.process_batch(
+                misses, language="en", batch_size=batch_size)
+            for text, nlp_artifacts in batch:
+                redacted[text] = self._redact_uncached(text, nlp_artifacts)
+        return [redacted[t] for t in texts]
+
+    def _redact_uncached(self, text: str, nlp_artifacts=None) -> str:
+        if len(self._cache) >= self._MAX_CACHED_TEXTS:
+            # Bound memory on subjects with very many distinct texts. A
+            # plain reset is enough: repeats cluster within a file.
+            self._cache.clear()
+        if not self._has_recognizers:
+            # nothing to detect (Presidio raises when no recognizer serves the entity)
+            self._cache[text] = text
+            return text
+        if nlp_artifacts is None and not self._needs_nlp:
+            nlp_artifacts = _empty_nlp_artifacts()
         results = self.analyzer.analyze(
-            text=text, entities=["SUBJECT_NAME"], language="en")
+            text=text, entities=["SUBJECT_NAME"], language="en",
+            nlp_artifacts=nlp_artifacts)
+        if not results:
+            # The common "no PHI" case: nothing to replace, so skip the
+            # anonymizer's operator/merge machinery entirely.
+            self._cache[text] = text
+            return text
         redacted = self.anonymizer.anonymize(
             text=text, analyzer_results=results,
             operators=self._operators).text
@@ -381,14 +626,42 @@ def redact_subject_name(text: str,
 
     If ``redactor`` is provided, the pre-built engines are reused — strongly
     preferred when calling this function many times for the same subject.
-    Otherwise a fresh engine is built for each call (backward-compatible
-    behaviour; slow if invoked repeatedly).
+    Otherwise a redactor for ``(subject_full_name, replacement)`` is taken
+    from a small module-level cache, so repeated calls for the same
+    subject don't rebuild (recompile) the recognizers either.
     """
     if redactor is None:
-        redactor = SubjectNameRedactor(subject_full_name, replacement=replacement)
+        redactor = get_subject_name_redactor(subject_full_name, replacement)
     return redactor.redact(text)
 
 
+@lru_cache(maxsize=8)
+def get_subject_name_redactor(subject_full_name: PersonalName,
+                              replacement: str = REDACT_NAME_REPLACEMENT) -> SubjectNameRedactor:
+    """Shared SubjectNameRedactor for ``(subject_full_name, replacement)``,
+    built on first use and then reused, so callers redacting many texts
+    for the same subject don't rebuild (recompile) the recognizers."""
+    return SubjectNameRedactor(subject_full_name, replacement=replacement)
+
+
+def redact_subject_names_batch(items: Iterable[Tuple[str, PersonalName]],
+                               replacement: str = REDACT_NAME_REPLACEMENT) -> List[str]:
+    """Redact many ``(text, subject_full_name)`` pairs, building one
+    SubjectNameRedactor per distinct subject and batching each subject's
+    texts through it with ``redact_many``. Output order matches ``items``."""
+    items = list(items)
+    positions_by_name = {}
+    for i, (_, name) in enumerate(items):
+        positions_by_name.setdefault(name, []).append(i)
+    redacted = [None] * len(items)
+    for name, positions in positions_by_name.items():
+        redactor = get_subject_name_redactor(name, replacement)
+        outputs = redactor.redact_many(items[i][0] for i in positions)
+        for i, out in zip(positions, outputs):
+            redacted[i] = out
+    return redacted
+
+
 # ---------- example ----------
 if __name__ == "__main__":
     subject = "John P. O'Connor"
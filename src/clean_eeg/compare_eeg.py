@@ -7,6 +7,7 @@ def compare_edf_files(file1, file2,
                       load_method='pyedflib',
                       physical_range_rel_tol=0.0,
                       compare_signals=True,
+                      stream=False,
                       verbosity=0):
     """
     Compare two EDF files for equality.
@@ -15,21 +16,58 @@ def compare_edf_files(file1, file2,
         file1 (str): Path to the first EDF file.
         file2 (str): Path to the second EDF file.
         load_method (str): Method to load EDF files ('pyedflib').
+        stream (bool): Compare signals one channel at a time instead of
+            preloading both files, stopping at the first differing channel.
+            Peak memory is two channels rather than two whole files.
 
     Returns:
         bool: True if files are equal, False otherwise.
     """
-    data1 = load_edf(file1, load_method=load_method, preload=compare_signals, read_digital=True)
-    data2 = load_edf(file2, load_method=load_method, preload=compare_signals, read_digital=True)
+    preload = compare_signals and not stream
+    data1 = load_edf(file1, load_method=load_method, preload=preload, read_digital=True)
+    data2 = load_edf(file2, load_method=load_method, preload=preload, read_digital=True)
 
     if load_method == 'pyedflib':
-        return compare_edf_pyedflib(data1, data2,
-                                    physical_range_rel_tol=physical_range_rel_tol,
-                                    verbosity=verbosity)
+        is_equal = compare_edf_pyedflib(data1, data2,
+                                        physical_range_rel_tol=physical_range_rel_tol,
+                                        verbosity=verbosity)
+        if compare_signals and stream:
+            is_equal = compare_edf_signals_streamed(file1, file2, verbosity=verbosity) and is_equal
+        return is_equal
     else:
         raise ValueError("Invalid load method specified. Use 'pyedflib'.")
 
 
+def compare_edf_signals_streamed(file1, file2,
+                                 match_initial_values_only=True,
+                                 verbosity=0):
+    """Channel-by-channel equivalent of ``compare_pyedflib_signals`` on
+    the digital samples of two EDF files."""
+    import pyedflib
+    with pyedflib.EdfReader(file1) as reader1, pyedflib.EdfReader(file2) as reader2:
+        n_signals = reader1.signals_in_file
+        if n_signals != reader2.signals_in_file:
+            if verbosity > 0:
+                print(f"Number of channels differ: {n_signals} vs {reader2.signals_in_file}")
+            return False
+        for i in range(n_signals):
+            signal1 = reader1.readSignal(i, digital=True)
+            signal2 = reader2.readSignal(i, digital=True)
+            if len(signal1) != len(signal2):
+                if not match_initial_values_only:
+                    if verbosity > 0:
+                        print(f"Signal {i} length differs: {len(signal1)} vs {len(signal2)}")
+                    return False
+                min_length = min(len(signal1), len(signal2))
+                signal1 = signal1[:min_length]
+                signal2 = signal2[:min_length]
+            if not np.array_equal(signal1, signal2):
+                if verbosity > 0:
+                    print(f"Signals differ (first differing channel: {i}).")
+                return False
+    return True
+
+
 def compare_edf_pyedflib(data1, data2, physical_range_rel_tol=1e-03, verbosity=0):
     if not isinstance(data1, dict) or not isinstance(data2, dict):
         raise ValueError("Data loaded with pyedflib should be a dictionary.")
@@ -41,12 +79,13 @@ def compare_edf_pyedflib(data1, data2, physical_range_rel_tol=1e-03, verbosity=0
                                                            physical_range_rel_tol=physical_range_rel_tol,
                                                            verbosity=verbosity)
     
-    if np.logical_xor(data1['signals'] is None, data2['signals'] is None):
+    if (data1['signals'] is None) != (data2['signals'] is None):
         raise ValueError("Signals present in one but not both data dictionaries.")
+    signals_equal = True  # header-only loads have no signals to compare
     if data1['signals'] is not None and data2['signals'] is not None:
         signals_equal = compare_pyedflib_signals(data1['signals'], data2['signals'], verbosity=verbosity)
     
-    if np.logical_xor('annotations' in data1, 'annotations' in data2):
+    if ('annotations' in data1) != ('annotations' in data2):
         raise ValueError("Annotations present in one but not both data dictionaries.")
     if 'annotations' in data1 and 'annotations' in data2:
         annotations_equal = compare_pyedflib_annotations(data1['annotations'],
@@ -79,18 +118,26 @@ def compare_pyedflib_signal_headers(signal_headers1, signal_headers2,
             print(f"Signal headers length differ: {len(signal_headers1)} vs {len(signal_headers2)}")
         is_equal = False
     else:
-        def isclose_key_value(di1, di2, key, rtol):
-            return key in di1 and key in di2 and np.isclose(di1[key], di2[key], rtol=rtol)
-        for sh1, sh2 in zip(signal_headers1, signal_headers2):
-            physical_range_keys = ['physical_min', 'physical_max']
+        physical_range_keys = ('physical_min', 'physical_max')
+        if physical_range_rel_tol > 0:
+            # separately check physical ranges for approximate equality
+            # luna can slightly modify physical ranges
+            # One vectorized isclose over (n_signals, 2) arrays instead of a
+            # scalar np.isclose per (signal, key). A missing key becomes NaN,
+            # which never compares close — same as requiring it in both.
+            def physical_ranges(signal_headers):
+                return np.array([[sh.get(key, np.nan) for key in physical_range_keys]
+                                 for sh in signal_headers],
+                                dtype=float).reshape(-1, len(physical_range_keys))
+            ranges_close = np.isclose(physical_ranges(signal_headers1),
+                                      physical_ranges(signal_headers2),
+                                      rtol=physical_range_rel_tol)
+        for i, (sh1, sh2) in enumerate(zip(signal_headers1, signal_headers2)):
             if physical_range_rel_tol > 0:
-                # separately check physical ranges for approximate equality
-                # luna can slightly modify physical ranges
-                for sh1, sh2 in zip(signal_headers1, signal_headers2):
-                    for key in physical_range_keys:
-                        if not isclose_key_value(sh1, sh2, key, rtol=physical_range_rel_tol):
-                            print(f"{key} differ:", sh1, "vs", sh2)
-                            is_equal = False
+                for key, key_close in zip(physical_range_keys, ranges_close[i]):
+                    if not key_close:
+                        print(f"{key} differ:", sh1, "vs", sh2)
+                        is_equal = False
                 sh1 = {k: v for k, v in sh1.items() if k not in physical_range_keys}
                 sh2 = {k: v for k, v in sh2.items() if k not in physical_range_keys}
             if sh1 != sh2:
@@ -103,37 +150,50 @@ def compare_pyedflib_signal_headers(signal_headers1, signal_headers2,
 def compare_pyedflib_signals(signals1, signals2,
                              match_initial_values_only=True,
                              verbosity=0):
-    is_equal = True
-    signals1 = np.array(signals1)
-    signals2 = np.array(signals2)
-    if not isinstance(signals1, np.ndarray) or not isinstance(signals2, np.ndarray):
-        print(signals1)
-        raise ValueError("Signals should be numpy arrays.")
-    if signals1.shape != signals2.shape:
+    """Compare two per-channel signal sequences (pyedflib's list of
+    arrays, or a 2D array). Channels are compared one at a time, without
+    first stacking each side into a fresh 2D copy — which also handles
+    channels of different sample rates (ragged lists). With
+    ``match_initial_values_only``, channels of unequal length are
+    compared over their common initial samples."""
+    if len(signals1) != len(signals2):
         if verbosity > 0:
-            print(f"Signals shape differ: {signals1.shape} vs {signals2.shape}")
-        if match_initial_values_only:
-            if len(signals1) != len(signals2):
-                if verbosity > 0:
-                    print(f"Number of channels differ: {len(signals1)} vs {len(signals2)}")
+            print(f"Number of channels differ: {len(signals1)} vs {len(signals2)}")
+        return False
+    is_equal = True
+    n_values = n_values_different = n_values_not_close = n_channels_different = 0
+    for i, (signal1, signal2) in enumerate(zip(signals1, signals2)):
+        signal1 = np.asarray(signal1)
+        signal2 = np.asarray(signal2)
+        if signal1.shape != signal2.shape:
+            if verbosity > 0:
+                print(f"Signal {i} shape differ: {signal1.shape} vs {signal2.shape}")
+            if not match_initial_values_only:
                 return False
-            min_length = min(signals1.shape[1], signals2.shape[1])
-            max_length = max(signals1.shape[1], signals2.shape[1])
-            signals1 = signals1[:, :min_length]
-            signals2 = signals2[:, :min_length]
+            min_length = min(len(signal1), len(signal2))
+            max_length = max(len(signal1), len(signal2))
+            signal1 = signal1[:min_length]
+            signal2 = signal2[:min_length]
             if verbosity > 0:
-                print(f"WARNING: Comparing only first {min_length} samples of each signal (dropping {max_length - min_length} samples from comparison).")
-        else:
-            return False
-    
-    if not np.array_equal(signals1, signals2):
-        if verbosity > 0:
-            print("Signals differ.")
-            print('Proportion of values different:', np.mean(signals1 != signals2))
-            print('Proportion not close:', np.mean(~np.isclose(signals1, signals2, rtol=1e-03)))
-            print(signals1.shape)
-            print('Proportion of channels different:', np.mean(np.any(signals1 != signals2, axis=1)))
+                print(f"WARNING: Comparing only first {min_length} samples of signal {i} "
+                      f"(dropping {max_length - min_length} samples from comparison).")
+        n_values += signal1.size
+        # single C-level scan on the (common) equal path; the statistics
+        # below are diagnostics only
+        if np.array_equal(signal1, signal2):
+            continue
         is_equal = False
+        if verbosity <= 0:
+            return False  # no diagnostics wanted: stop at the first differing channel
+        n_channels_different += 1
+        n_values_different += np.count_nonzero(np.not_equal(signal1, signal2))
+        n_values_not_close += np.count_nonzero(~np.isclose(signal1, signal2, rtol=1e-03))
+    if not is_equal:
+        print("Signals differ.")
+        print('Proportion of values different:', n_values_different / n_values)
+        print('Proportion not close:', n_values_not_close / n_values)
+        print(f"{len(signals1)} channels, {n_values} values compared")
+        print('Proportion of channels different:', n_channels_different / len(signals1))
     return is_equal
 
 
@@ -144,18 +204,26 @@ def compare_pyedflib_annotations(annotations1, annotations2, verbosity=0):
     for arr1, arr2 in zip(annotations1, annotations2):
         if not isinstance(arr1, np.ndarray) or not isinstance(arr2, np.ndarray):
             raise ValueError("Each annotation item should be a numpy array.")
-    annotations1 = np.array(annotations1).T
-    annotations2 = np.array(annotations2).T
-    if len(annotations1) != len(annotations2):
+    # Compare the (onsets, durations, texts) columns as they are rather
+    # than stacking them into one string array and looping over rows:
+    # one vectorized pass per column, and a Python loop only over the
+    # rows that differ.
+    onsets1, durations1, texts1 = annotations1
+    onsets2, durations2, texts2 = annotations2
+    if len(onsets1) != len(onsets2):
         if verbosity > 0:
-            print(f"Annotations length differ: {len(annotations1)} vs {len(annotations2)}")
+            print(f"Annotations length differ: {len(onsets1)} vs {len(onsets2)}")
         is_equal = False
     else:
-        for ann1, ann2 in zip(annotations1, annotations2):
-            if np.any(ann1 != ann2):
-                if verbosity > 0:
-                    print(f"Annotations differ:\n{ann1}\n{ann2}")
-                is_equal = False
+        rows_differ = (np.not_equal(onsets1, onsets2)
+                       | np.not_equal(durations1, durations2)
+                       | np.not_equal(texts1, texts2))
+        if rows_differ.any():
+            if verbosity > 0:
+                for i in np.flatnonzero(rows_differ):
+                    print(f"Annotations differ:\n{(onsets1[i], durations1[i], texts1[i])}\n"
+                          f"{(onsets2[i], durations2[i], texts2[i])}")
+            is_equal = False
     return is_equal
 
 
@@ -166,6 +234,8 @@ if __name__ == "__main__":
     parser.add_argument("--path2", type=str, required=True, help="Path to second EDF file to compare")
     parser.add_argument("--load-method", type=str, default="pyedflib", help="Method to load EDF files: 'pyedflib'")
     parser.add_argument("--lazy-load", action="store_true", help="Preload EEG into memory")
+    parser.add_argument("--stream", action="store_true",
+                        help="Compare signals one channel at a time instead of preloading both files")
     parser.add_argument("--raise-errors", action="store_true", help="Raise errors instead of warnings for debugging")
     parser.add_argument("--verbosity", type=int, default=1, help="Enable verbose output")
     args = parser.parse_args()
@@ -173,5 +243,6 @@ if __name__ == "__main__":
     compare_edf_files(args.path1, args.path2,
                       load_method=args.load_method,
                       compare_signals=not args.lazy_load,
+                      stream=args.stream,
                       physical_range_rel_tol=1e-3,
                       verbosity=args.verbosity)
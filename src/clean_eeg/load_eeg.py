@@ -1,4 +1,5 @@
 import argparse
+import os
 
 
 RESERVED_FIELD_EDF_HEADER_BYTE_OFFSET = 192
@@ -273,21 +274,29 @@ def print_edf_pyedflib(data, verbosity=1):
 
 
 def validate_edf_file_path(input_file: str) -> None:
-    import os
     if not os.path.isfile(input_file):
         raise FileNotFoundError(f"EDF file not found: {input_file}")
-    if not input_file.lower().endswith('.edf'):
+    # lowercase only the last four characters, not the whole path
+    # (same result as .lower().endswith('.edf'), incl. for a bare '.edf')
+    if input_file[-4:].lower() != '.edf':
         raise ValueError(f"File does not have .edf extension: {input_file}")
 
 
 def get_edf_reserved_field(input_file: str) -> str:
     # 'reserved' header field in EDF+ standard must start with 'EDF+C' or 'EDF+D' for continuous or discontinuous files
     validate_edf_file_path(input_file)
-    with open(input_file, 'rb') as f:
-        f.seek(RESERVED_FIELD_EDF_HEADER_BYTE_OFFSET)
-        reserved_field_bytes = f.read(44)
-        reserved_field = reserved_field_bytes.decode('ascii')
-    return reserved_field
+    # Raw fd + positional read: no buffered file object and no separate
+    # seek. os.pread is POSIX-only, so fall back to lseek + read elsewhere.
+    fd = os.open(input_file, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if hasattr(os, 'pread'):
+            reserved_field_bytes = os.pread(fd, 44, RESERVED_FIELD_EDF_HEADER_BYTE_OFFSET)
+        else:
+            os.lseek(fd, RESERVED_FIELD_EDF_HEADER_BYTE_OFFSET, os.SEEK_SET)
+            reserved_field_bytes = os.read(fd, 44)
+    finally:
+        os.close(fd)
+    return reserved_field_bytes.decode('ascii')
 
 
 def is_edfD(input_file: str) -> bool:
@@ -313,11 +322,14 @@ def is_edf_continuous(input_file: str) -> bool:
 
 
 def print_edf_file_type(input_file: str) -> None:
-    if is_edfC(input_file):
+    # read the reserved field once rather than once per is_edf* check
+    # (not cached by path: the pipeline rewrites headers in place)
+    reserved_field = get_edf_reserved_field(input_file)
+    if reserved_field[:5] == 'EDF+C':
         print(f"{input_file} is an EDF+C (continuous) file.")
-    elif is_edfD(input_file):
+    elif reserved_field[:5] == 'EDF+D':
         print(f"{input_file} is an EDF+D (discontinuous) file.")
-    elif is_edf_plus(input_file):
+    elif reserved_field[:4] == 'EDF+':
         print(f"{input_file} 'reserved field' starts with 'EDF+' but "
               "not specifically 'EDF+C' or 'EDF+D' and is EDF+ non-compliant.")
     else:
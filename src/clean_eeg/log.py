@@ -17,7 +17,8 @@ class PipelineLogger:
 
     def __init__(self, log_path: str):
         self.log_path = log_path
-        self._phi_patterns = []
+        self._phi_texts: list[str] = []
+        self._phi_re = None  # all registered PHI strings as one pattern
         self.log_file = open(log_path, "w")
         self._orig_stdout = sys.stdout
         self._orig_stderr = sys.stderr
@@ -41,15 +42,21 @@ class PipelineLogger:
         text = text.strip()
         if sum(c.isalpha() for c in text) < 3:
             return
-        self._phi_patterns.append(
-            re.compile(r"\b" + re.escape(text) + r"\b", re.IGNORECASE)
+        self._phi_texts.append(text)
+        # One alternation (longest first, so a longer name part wins over a
+        # prefix of it) instead of one pattern per part: every write through
+        # the tee — including each tqdm refresh — is scanned once.
+        alternatives = sorted(set(self._phi_texts), key=len, reverse=True)
+        self._phi_re = re.compile(
+            r"\b(?:" + "|".join(map(re.escape, alternatives)) + r")\b",
+            re.IGNORECASE,
         )
 
     def scrub(self, text: str) -> str:
         """Replace all registered PHI patterns in text."""
-        for pat in self._phi_patterns:
-            text = pat.sub("[PHI_REDACTED]", text)
-        return text
+        if self._phi_re is None:
+            return text
+        return self._phi_re.sub("[PHI_REDACTED]", text)
 
     def write_to_log(self, text: str):
         self.log_file.write(self.scrub(text))
@@ -1,6 +1,5 @@
 # edf_inplace.py
 from typing import Dict, List, Union
-from copy import deepcopy
 import datetime
 import os
 import re
@@ -43,15 +42,16 @@ def update_edf_header_inplace(edf_path: str,
         # the orig's main-header data_record_duration we copy back below.
         orig_record_duration = f.datarecord_duration
         if confirm_signals_unchanged:
-            # load original signals for later comparison
-            orig_signals = [f.readSignal(i) for i in range(f.signals_in_file)]
+            # load original signals for later comparison. Digital samples
+            # are the on-disk integers: no physical scaling pass, half the
+            # memory of float64, and an exact test of "data unchanged".
+            orig_signals = [f.readSignal(i, digital=True) for i in range(f.signals_in_file)]
     
     # Apply updates to header fields
     updated_header = orig_header.copy()
     for field, value in header_updates.items():
         if value is not None:
             updated_header[field] = value
-    # updated_header = clean_header(updated_header, raise_errors=False)
 
     if signal_header_updates is not None:
         if len(signal_header_updates) != len(orig_signal_headers):
@@ -89,9 +89,8 @@ def update_edf_header_inplace(edf_path: str,
                              'num_signals',
                              'num_data_records',
                              'data_record_duration']
-    for field in copy_overwrite_fields:
-        copy_bytes(edf_path, temp_path,
-                   *EDF_HEADER_FIELD_OFFSETS_LENGTHS[field][:2])
+    copy_ranges = [EDF_HEADER_FIELD_OFFSETS_LENGTHS[field][:2]
+                   for field in copy_overwrite_fields]
 
     # Preserve the original file's signal-header numeric fields. These
     # describe the actual on-disk data layout (physical/digital ranges and,
@@ -112,7 +111,9 @@ def update_edf_header_inplace(edf_path: str,
         field_offset, field_width, _ = EDF_SIGNAL_HEADER_FIELD_OFFSETS_LENGTHS[field]
         abs_offset = TOTAL_HEADER_BYTES + field_offset * on_disk_n_signals
         total_length = field_width * on_disk_n_signals
-        copy_bytes(edf_path, temp_path, abs_offset, total_length)
+        copy_ranges.append((abs_offset, total_length))
+    # one open of each file for all main- and signal-header ranges
+    copy_byte_ranges(edf_path, temp_path, copy_ranges)
 
     # Copy updated header bytes back to original file
     with open(edf_path, "r+b") as orig_file, open(temp_path, "rb") as temp_file:
@@ -126,8 +127,8 @@ def update_edf_header_inplace(edf_path: str,
     if confirm_signals_unchanged:
         with pyedflib.EdfReader(edf_path) as f:
             for i in range(f.signals_in_file):
-                updated_signal = f.readSignal(i)
-                if not all(updated_signal == orig_signals[i]):
+                updated_signal = f.readSignal(i, digital=True)
+                if not np.array_equal(updated_signal, orig_signals[i]):
                     raise ValueError(f"Signal {i} changed after in-place header update")
 
     os.remove(temp_path)
@@ -515,12 +516,18 @@ def read_header_raw_bytes(edf_path):
 
 
 def copy_bytes(src_path, dest_path, offset, length):
-    with open(src_path, "rb") as src_file:
-        src_file.seek(offset)
-        bytes_data = src_file.read(length)
-    with open(dest_path, "r+b") as dest_file:
-        dest_file.seek(offset)
-        dest_file.write(bytes_data)
+    copy_byte_ranges(src_path, dest_path, [(offset, length)])
+
+
+def copy_byte_ranges(src_path, dest_path, ranges):
+    """Copy each ``(offset, length)`` byte range of ``src_path`` to the same
+    offset in ``dest_path``, opening each file once for all ranges."""
+    with open(src_path, "rb") as src_file, open(dest_path, "r+b") as dest_file:
+        for offset, length in ranges:
+            src_file.seek(offset)
+            bytes_data = src_file.read(length)
+            dest_file.seek(offset)
+            dest_file.write(bytes_data)
 
 
 if __name__ == "__main__":
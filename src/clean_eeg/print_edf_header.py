@@ -584,12 +584,13 @@ def _gather_paths(path: str, *, recursive: bool = False,
                         continue
                     collected.append(os.path.join(root, f))
             return sorted(collected)
-        return sorted(
-            os.path.join(path, f)
-            for f in os.listdir(path)
-            if f.lower().endswith(".edf")
-            and (include_annotation_stubs or not _is_annotation_stub(f))
-        )
+        with os.scandir(path) as entries:
+            return sorted(
+                e.path
+                for e in entries
+                if e.name.lower().endswith(".edf")
+                and (include_annotation_stubs or not _is_annotation_stub(e.name))
+            )
     raise FileNotFoundError(f"No such file or directory: {path}")
 
 
@@ -20,6 +20,7 @@ def load_whitelist() -> Set[str]:
     return white_list
 
 NAME_WORD_RE = re.compile(r"\b\p{L}+(?:['’\-]\p{L}+)*\b", re.UNICODE)
+_PUNCT_TABLE = str.maketrans("", "", "-'’")
 
 def token_in_whitelist(token: str, whitelist: Set[str]) -> bool:
     """
@@ -28,5 +29,5 @@ def token_in_whitelist(token: str, whitelist: Set[str]) -> bool:
     t = token.lower()
     if t in whitelist:
         return True
-    t2 = re.sub(r"[-'’]", "", t)
+    t2 = t.translate(_PUNCT_TABLE)
     return t2 in whitelist
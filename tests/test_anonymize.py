@@ -373,3 +373,231 @@ def test_redactor_caches_are_independent_per_subject():
     assert a_result == text
     assert REDACT_NAME_REPLACEMENT in b_result
     assert red_a._cache is not red_b._cache
+    # ...while the spaCy engine is loaded once and shared
+    assert red_a.analyzer.nlp_engine is red_b.analyzer.nlp_engine
+    assert red_a.registry is not red_b.registry
+
+
+def test_redact_subject_names_batch_matches_single_calls():
+    from clean_eeg.anonymize import redact_subject_names_batch
+
+    jane = PersonalName(first_name='Jane', middle_names=[], last_name='Doe')
+    items = [("Jane arrived", PATIENT_NAME),
+             ("Jane arrived", jane),
+             ("Dr. John P. O'Connor signed", PATIENT_NAME),
+             ("Ms. Doe left", jane)]
+    assert redact_subject_names_batch(items) == \
+        [redact_subject_name(text, name) for text, name in items]
+
+
+def test_redact_subject_names_batch_reuses_cached_redactor(monkeypatch):
+    import clean_eeg.anonymize as anonymize_module
+    from clean_eeg.anonymize import redact_subject_names_batch
+
+    redact_subject_names_batch([("Jane arrived", PATIENT_NAME)])
+    # a second batch for the same subject builds no new redactor
+    monkeypatch.setattr(anonymize_module, 'SubjectNameRedactor',
+                        lambda *a, **k: pytest.fail("redactor rebuilt"))
+    assert redact_subject_names_batch([("John left", PATIENT_NAME)]) == \
+        [redact_subject_name("John left", PATIENT_NAME)]
+
+
+def test_fuzzy_recognizer_matches_pairwise_levenshtein():
+    """The vectorized (cdist) fuzzy recognizer must flag exactly the
+    tokens, spans and scores that a pairwise Levenshtein loop would."""
+    from rapidfuzz.distance import Levenshtein
+    from clean_eeg.anonymize import (FuzzySubjectNameRecognizer, FUZZY_TOKEN_RE,
+                                     strip_punct)
+
+    targets = ["John", "O'Connor", "Smith-Jones", "Al"]
+    text = ("Jon met OConor and O'Connors; smithjones, Smith-Jone's and "
+            "Okonner saw Al, Johnny and Jahn at the clinic. Jon, the clinic, OConor.")
+    recognizer = FuzzySubjectNameRecognizer(targets)
+
+    expected = []
+    for m in FUZZY_TOKEN_RE.finditer(text):
+        token = m.group(1)
+        if len(token) < recognizer.min_detection_token_length:
+            continue
+        low, norm = token.lower(), strip_punct(token.lower())
+        for tgt in recognizer.targets_raw:
+            tgt_low, tgt_norm = tgt.lower(), strip_punct(tgt).lower()
+            if (Levenshtein.distance(low, tgt_low) <= 1
+                    or Levenshtein.distance(norm, tgt_norm) <= 1):
+                score = 1.0 if (low == tgt_low or norm == tgt_norm) else 0.9
+                expected.append((m.start(), m.end(), score))
+                break
+
+    results = recognizer.analyze(text, entities=["SUBJECT_NAME"])
+    assert [(r.start, r.end, r.score) for r in results] == expected
+    assert len(expected) >= 5
+    # second pass is served from the per-token score memo
+    results = recognizer.analyze(text, entities=["SUBJECT_NAME"])
+    assert [(r.start, r.end, r.score) for r in results] == expected
+    # ... and stays correct when the memo is reset mid-stream
+    recognizer._MAX_SCORED_TOKENS = 0
+    results = recognizer.analyze(text, entities=["SUBJECT_NAME"])
+    assert [(r.start, r.end, r.score) for r in results] == expected
+
+
+def test_denylist_recognizer_matches_presidio_pattern_recognizer():
+    """The trie-regex deny-list recognizer must find the same spans as
+    Presidio's PatternRecognizer(deny_list=...) it replaced."""
+    from presidio_analyzer import PatternRecognizer
+    from clean_eeg.anonymize import DenyListRecognizer, build_deny_variants
+
+    variants = build_deny_variants(["John", "Al", "O'Connor", "Smith-Jones", "Johnny"])
+    text = ("JOHN O'Connor met al and Alan; o’connor's note, SmithJones, "
+            "Johnny's and Johnathan saw OConnor's chart. john")
+    ours = DenyListRecognizer(variants).analyze(text, entities=["SUBJECT_NAME"])
+    # sort longest-first so Presidio's flat alternation also prefers the longest variant
+    reference = PatternRecognizer(
+        supported_entity="SUBJECT_NAME",
+        deny_list=sorted(variants, key=len, reverse=True),
+    ).analyze(text, entities=["SUBJECT_NAME"])
+    assert [(r.start, r.end, r.score) for r in ours] == \
+        [(r.start, r.end, r.score) for r in reference]
+    assert len(ours) >= 6
+
+
+def test_combined_recognizer_only_fuzzy_scores_uncovered_tokens():
+    from clean_eeg.anonymize import CombinedSubjectRecognizer, build_deny_variants
+
+    tokens = ["John", "O'Connor"]
+    recognizer = CombinedSubjectRecognizer(build_deny_variants(tokens), tokens)
+    text = "John O'Connor saw OConor"
+    spans = [(r.start, r.end, r.score)
+             for r in recognizer.analyze(text, entities=["SUBJECT_NAME"])]
+    # exact full-name hit from the deny list, one-edit hit from the fuzzy scan,
+    # and no duplicate fuzzy results inside the deny-list span
+    assert spans == [(0, 13, 1.0), (18, 24, 0.9)]
+
+
+def test_build_deny_variants_is_casefolded_frozenset():
+    from clean_eeg.anonymize import build_deny_variants
+
+    variants = build_deny_variants(["John", "O'Connor"])
+    assert isinstance(variants, frozenset)
+    assert variants == {
+        "john", "john's", "john’s",
+        "o'connor", "o'connor's", "o'connor’s",
+        "oconnor", "oconnor's", "oconnor’s",
+        "john o'connor", "john o'connor's", "john o'connor’s",
+        "john oconnor", "john oconnor's", "john oconnor’s",
+    }
+
+
+def test_personal_name_is_hashable_and_accepts_list_middle_names():
+    a = PersonalName(first_name="John", middle_names=["P."], last_name="O'Connor")
+    b = PersonalName(first_name="John", middle_names=("P.",), last_name="O'Connor")
+    assert a == b and hash(a) == hash(b)
+    assert a.middle_names == ("P.",)
+    assert a.get_full_name() == "John P. O'Connor"
+    assert a.get_normalized_tokens() == ["John", "P.", "O'Connor"]
+    with pytest.raises(AttributeError):
+        a.first_name = "Jane"
+
+
+@pytest.mark.parametrize("token, expected", [
+    ("O'Connor", r"O['’-]?Connor"),
+    ("Smith-Jones", r"Smith['’-]?Jones"),
+    ("D’Angelo", r"D['’-]?Angelo"),
+    ("P.", r"P\."),
+])
+def test_make_token_regex_allow_optional_punct(token, expected):
+    from clean_eeg.anonymize import make_token_regex_allow_optional_punct
+    assert make_token_regex_allow_optional_punct(token) == expected
+
+
+def test_redact_many_matches_redact_and_fills_cache():
+    from clean_eeg.anonymize import SubjectNameRedactor
+
+    texts = ["Dr. John P. O'Connor", "uV", "OConor said", "uV", "", "Jon left"]
+    batched = SubjectNameRedactor(PATIENT_NAME).redact_many(texts, batch_size=2)
+    single = SubjectNameRedactor(PATIENT_NAME)
+    assert batched == [single.redact(t) for t in texts]
+
+    redactor = SubjectNameRedactor(PATIENT_NAME)
+    redactor.redact_many(texts)
+    assert set(redactor._cache) == set(texts)
+
+    # batched spaCy path, taken when a recognizer needs the parse
+    nlp_redactor = SubjectNameRedactor(PATIENT_NAME)
+    nlp_redactor._needs_nlp = True
+    assert nlp_redactor.redact_many(texts, batch_size=2) == batched
+
+    # a cache reset in the middle of a batch must not lose results
+    small = SubjectNameRedactor(PATIENT_NAME)
+    small._MAX_CACHED_TEXTS = 2
+    small._needs_nlp = True
+    assert small.redact_many(texts, batch_size=2) == batched
+    assert len(small._cache) <= 2
+
+
+def test_redactor_skips_spacy_for_text_only_recognizers(monkeypatch):
+    from clean_eeg.anonymize import SubjectNameRedactor
+
+    redactor = SubjectNameRedactor(PATIENT_NAME)
+    assert not redactor._needs_nlp
+
+    def fail(*args, **kwargs):
+        raise AssertionError("spaCy parse should not run")
+
+    monkeypatch.setattr(redactor.analyzer.nlp_engine, "process_text", fail)
+    monkeypatch.setattr(redactor.analyzer.nlp_engine, "process_batch", fail)
+    assert redactor.redact("Dr. John P. O'Connor") == "X"
+    assert redactor.redact_many(["Jon left", "uV"]) == ["X left", "uV"]
+
+
+@pytest.mark.parametrize("name", ["John", "Elizabeth", "Al", "Zzyzx"])
+@pytest.mark.parametrize("levels", [1, 2, 3])
+def test_get_name_variants_matches_full_level_expansion(name, levels):
+    from nicknames import NickNamer
+    from clean_eeg.anonymize import get_name_variants
+
+    nicknamer = NickNamer()
+    expected = {name}
+    for _ in range(levels):
+        for variant in expected.copy():
+            expected |= nicknamer.nicknames_of(variant) | nicknamer.canonicals_of(variant)
+    assert get_name_variants(name, levels=levels) == expected
+
+
+def test_no_op_recognizers_are_not_registered():
+    from clean_eeg.anonymize import SubjectNameRedactor
+
+    def subject_recognizers(redactor):
+        return [r.name for r in redactor.registry.recognizers
+                if "SUBJECT_NAME" in r.supported_entities]
+
+    no_last = SubjectNameRedactor(PersonalName(first_name="Jane", middle_names=[], last_name=""))
+    assert subject_recognizers(no_last) == ["subject_name_combined"]
+    assert no_last.redact("Dr. Jane left") == f"Dr. {REDACT_NAME_REPLACEMENT} left"
+
+    empty = SubjectNameRedactor(PersonalName(first_name="", middle_names=[], last_name=""))
+    assert subject_recognizers(empty) == []
+    assert empty.redact("Dr. Jane left") == "Dr. Jane left"
+
+
+def test_title_recognizer_literal_prefilter():
+    from presidio_analyzer import PatternRecognizer
+    from clean_eeg.anonymize import TitleAndInitialsRecognizer
+
+    recognizer = TitleAndInitialsRecognizer(PATIENT_NAME)  # John P. O'Connor
+    for text in ["Dr. J. P. OConnor's note", "Prof O-Connor", "DrJohnPO’Connor",
+                 "Dr. Smith and Dr. Jones", "no names here"]:
+        expected = PatternRecognizer.analyze(recognizer, text, ["SUBJECT_NAME"])
+        got = recognizer.analyze(text, ["SUBJECT_NAME"])
+        assert [(r.start, r.end) for r in got] == [(r.start, r.end) for r in expected]
+
+
+def test_redact_subject_name_reuses_redactor_per_subject():
+    from clean_eeg.anonymize import get_subject_name_redactor
+
+    same = PersonalName(first_name="John", middle_names=["P."], last_name="O'Connor")
+    redact_subject_name("John left", PATIENT_NAME)
+    assert get_subject_name_redactor(PATIENT_NAME, REDACT_NAME_REPLACEMENT) is \
+        get_subject_name_redactor(same, REDACT_NAME_REPLACEMENT)
+    assert get_subject_name_redactor(PATIENT_NAME, "Y") is not \
+        get_subject_name_redactor(PATIENT_NAME, REDACT_NAME_REPLACEMENT)
+    assert redact_subject_name("John left", PATIENT_NAME, replacement="Y") == "Y left"
@@ -1,7 +1,10 @@
+import multiprocessing
 import numpy as np
 import os
 import shutil
+import sys
 import pytest
+import re
 
 from clean_eeg.clean_subject_eeg import remove_gendered_pronouns, _GENDERED_PRONOUNS, BASE_START_DATE,\
         DEFAULT_REDACT_HEADER_KEYS, REDACT_REPLACEMENT, REDACT_PRONOUN_REPLACEMENT, clean_subject_edf_files, \
@@ -9,7 +12,7 @@ from clean_eeg.clean_subject_eeg import remove_gendered_pronouns, _GENDERED_PRON
 from clean_eeg.load_eeg import load_edf
 from tests.generate_edf import format_edf_config_json
 from clean_eeg.paths import TEST_DATA_DIR, TEST_CONFIG_FILE, TEST_SUBJECT_DATA_DIR, INCONSISTENT_SUBJECT_DATA_DIR
-from clean_eeg.anonymize import PersonalName, REDACT_NAME_REPLACEMENT
+from clean_eeg.anonymize import PersonalName, REDACT_NAME_REPLACEMENT, SubjectNameRedactor
 
 from datetime import datetime, timedelta
 import json
@@ -25,6 +28,60 @@ def test_remove_gendered_pronouns_basic():
     output = ' asdf '.join([REDACT_PRONOUN_REPLACEMENT] * len(_GENDERED_PRONOUNS))
     assert remove_gendered_pronouns(input) == output
 
+
+@pytest.mark.parametrize("text, expected", [
+    ("SHE said HIS name", "X said X name"),
+    ("Her own", "X own"),
+    ("other thesis", "other thesis"),
+    ("spike wave 3 Hz", "spike wave 3 Hz"),
+    ("no match at all", "no match at all"),
+    ("éhe said his", "éhe said X"),  # non-ASCII text takes the Unicode pattern
+    ("Ŝhe his", "Ŝhe X"),
+])
+def test_remove_gendered_pronouns_case_and_substrings(text, expected):
+    assert remove_gendered_pronouns(text) == expected
+    assert remove_gendered_pronouns(text, replacement="") == \
+        expected.replace("X", "")
+
+@pytest.mark.parametrize("code, valid", [
+    ("R1755A", True), ("R1234T", True),
+    ("R1755B", False), ("R175A", False), ("r1755A", False), ("R1755AA", False),
+    ("R1755A\n", False),
+])
+def test_is_valid_subject_code(code, valid):
+    from clean_eeg.clean_subject_eeg import is_valid_subject_code
+    assert is_valid_subject_code(code, raise_error=False) is valid
+    if valid:
+        assert is_valid_subject_code(code) is True
+    else:
+        with pytest.raises(ValueError, match="Invalid subject code"):
+            is_valid_subject_code(code)
+
+
+def test_is_valid_subject_code_rejects_montage_codes():
+    from clean_eeg.clean_subject_eeg import is_valid_subject_code
+    with pytest.raises(NotImplementedError):
+        is_valid_subject_code("R1755A_1")
+
+@pytest.mark.parametrize("text", ["", "   ", "+0.086", "-12.5", "12:30:00", "---", "1/2/3"])
+def test_redact_string_skips_letterless_text(text):
+    """Text without letters can't hold a name or pronoun and must never
+    reach the (expensive) name redactor."""
+    from clean_eeg.clean_subject_eeg import redact_string
+
+    class ExplodingRedactor:
+        def redact(self, text):
+            raise AssertionError("redactor called on letterless text")
+
+    assert redact_string(text, field_name="annotation", subject_name=None,
+                         redactor=ExplodingRedactor()) == text
+
+@pytest.mark.parametrize("dt", [datetime(1985, 1, 1), datetime(1985, 12, 31, 23, 59, 59),
+                                datetime(1986, 3, 7, 4, 5, 6, 789000)])
+def test_format_deid_timestamp_matches_strftime(dt):
+    from clean_eeg.clean_subject_eeg import _format_deid_timestamp
+    assert _format_deid_timestamp(dt) == dt.strftime('%m.%d__%H.%M.%S')
+
 EDF_CONFIG = TEST_CONFIG["basic_EDF+C"]
 EDF_TIMESTAMP_FORMAT = EDF_CONFIG['timestamp_format']
 EDF_CONFIG = format_edf_config_json(EDF_CONFIG)
@@ -57,6 +114,77 @@ def test_deidentify_edf_header():
     assert new_header['equipment'] == REDACT_PRONOUN_REPLACEMENT + ' ' + REDACT_NAME_REPLACEMENT
 
 
+def test_deidentify_edf_header_leaves_input_untouched():
+    from clean_eeg.clean_subject_eeg import deidentify_edf_header
+    header = dict(EDF_HEADER, equipment='his ' + PATIENT_NAME.get_full_name())
+    original = dict(header)
+    new_header = deidentify_edf_header(header,
+                                       earliest_recording_start_time=header['startdate'],
+                                       subject_code=SUBJECT_CODE,
+                                       subject_name=PATIENT_NAME)
+    assert new_header is not header
+    assert header == original
+
+
+def test_deidentify_edf_header_value_types():
+    from clean_eeg.clean_subject_eeg import deidentify_edf_header
+    # subclasses of the accepted types (numpy scalars, bool) pass through
+    header = dict(EDF_HEADER, record_duration=np.float64(1.0), admincode=True)
+    new_header = deidentify_edf_header(header,
+                                       earliest_recording_start_time=header['startdate'],
+                                       subject_code=SUBJECT_CODE,
+                                       subject_name=PATIENT_NAME)
+    assert new_header['record_duration'] == 1.0
+    assert new_header['admincode'] is True
+    with pytest.raises(ValueError, match='Unknown type'):
+        deidentify_edf_header(dict(EDF_HEADER, equipment=b'raw'),
+                              earliest_recording_start_time=EDF_HEADER['startdate'],
+                              subject_code=SUBJECT_CODE,
+                              subject_name=PATIENT_NAME)
+
+
+def test_deidentify_edf_shares_signals_and_copies_headers():
+    from clean_eeg.clean_subject_eeg import deidentify_edf
+    signals = np.zeros((2, 16))
+    signal_headers = [{'label': 'EEG C3', 'dimension': 'uV', 'transducer': 'Smith electrode',
+                       'prefilter': '', 'sample_frequency': 256.0}]
+    data = {'header': dict(EDF_HEADER), 'signal_headers': signal_headers,
+            'annotations': (np.array([]), np.array([]), np.array([])), 'signals': signals}
+    original_signal_headers = [dict(sh) for sh in signal_headers]
+    clean = deidentify_edf(data, subject_name=PATIENT_NAME, subject_code=SUBJECT_CODE,
+                           earliest_recording_start_time=EDF_HEADER['startdate'])
+    # signals are never modified, so they are shared rather than copied
+    assert clean['signals'] is signals
+    assert clean['signal_headers'][0] is not signal_headers[0]
+    assert signal_headers == original_signal_headers
+
+
+def test_deidentify_edf_redacts_repeated_signal_header_values_once():
+    from clean_eeg.clean_subject_eeg import deidentify_edf
+
+    class CountingRedactor:
+        def __init__(self):
+            self.calls = []
+
+        def redact(self, text):
+            self.calls.append(text)
+            return text.replace("Smith", REDACT_NAME_REPLACEMENT)
+
+    signal_headers = [{'label': f'EEG C{i}', 'dimension': 'uV', 'transducer': 'Smith electrode',
+                       'prefilter': 'HP:0.1Hz', 'sample_frequency': 256.0} for i in range(32)]
+    data = {'header': dict(EDF_HEADER), 'signal_headers': signal_headers,
+            'annotations': (np.array([]), np.array([]), np.array([])), 'signals': None}
+    redactor = CountingRedactor()
+    clean = deidentify_edf(data, subject_name=PATIENT_NAME, subject_code=SUBJECT_CODE,
+                           earliest_recording_start_time=EDF_HEADER['startdate'],
+                           redactor=redactor)
+    assert all(sh['transducer'] == f'{REDACT_NAME_REPLACEMENT} electrode'
+               for sh in clean['signal_headers'])
+    assert [sh['label'] for sh in clean['signal_headers']] == [f'EEG C{i}' for i in range(32)]
+    assert redactor.calls.count('Smith electrode') == 1
+    assert redactor.calls.count('uV') == 1
+
+
 def test_deidentify_edf_annotations():
     from clean_eeg.clean_subject_eeg import deidentify_edf_annotations
     data = load_edf(BASIC_EDF_PATH, load_method='pyedflib', preload=True)
@@ -75,6 +203,73 @@ def test_deidentify_edf_annotations():
     assert new_annotations[2][2] == REDACT_PRONOUN_REPLACEMENT + ' ' + REDACT_NAME_REPLACEMENT
 
 
+def test_deidentify_edf_annotations_without_letters_builds_no_redactor(monkeypatch):
+    """Empty or letter-free annotation sets need no redactor, so none is
+    built — and subject_name may be None."""
+    import clean_eeg.clean_subject_eeg as _csm
+    from clean_eeg.clean_subject_eeg import deidentify_edf_annotations
+
+    def fail(*args, **kwargs):
+        raise AssertionError("redactor should not be built")
+    monkeypatch.setattr(_csm, "get_subject_name_redactor", fail)
+
+    empty = deidentify_edf_annotations(([], [], []), None)
+    assert [len(column) for column in empty] == [0, 0, 0]
+    texts = np.array(['+0.5', '12:00:01', ''])
+    clean = deidentify_edf_annotations((np.arange(3.0), np.zeros(3), texts), None)
+    assert list(clean[2]) == list(texts)
+
+
+@pytest.mark.parametrize("needs_nlp", [False, True])
+def test_deidentify_edf_annotations_redacts_distinct_texts_once(monkeypatch, needs_nlp):
+    """Each distinct annotation text is analysed once. When the redactor
+    needs spaCy, the distinct texts go through one redact_many batch whose
+    results are used directly (no second per-row pass); otherwise no
+    batch is run and repeated rows hit the redactor's cache."""
+    from clean_eeg.clean_subject_eeg import deidentify_edf_annotations
+    redactor = SubjectNameRedactor(PATIENT_NAME)
+    redactor._needs_nlp = needs_nlp
+    batches, uncached, per_row = [], [], []
+    real_redact_many = redactor.redact_many
+    real_redact = redactor.redact
+    real_redact_uncached = redactor._redact_uncached
+
+    def spy_redact_many(texts, *args, **kwargs):
+        texts = list(texts)
+        batches.append(sorted(texts))
+        return real_redact_many(texts, *args, **kwargs)
+
+    def spy_redact(text):
+        per_row.append(text)
+        return real_redact(text)
+
+    def spy_redact_uncached(text, *args, **kwargs):
+        uncached.append(text)
+        return real_redact_uncached(text, *args, **kwargs)
+    monkeypatch.setattr(redactor, "redact_many", spy_redact_many)
+    monkeypatch.setattr(redactor, "redact", spy_redact)
+    monkeypatch.setattr(redactor, "_redact_uncached", spy_redact_uncached)
+
+    name = PATIENT_NAME.get_full_name()
+    texts = np.array(['his ' + name, 'Impedance check', '+0.5', 'his ' + name, 'Impedance check'])
+    annotations = (np.arange(5, dtype=float), np.zeros(5), texts)
+    review_events = []
+    clean = deidentify_edf_annotations(annotations, subject_name=PATIENT_NAME,
+                                       redactor=redactor, review_events=review_events)
+
+    distinct = sorted(['his ' + name, 'Impedance check'])
+    assert sorted(uncached) == distinct
+    if needs_nlp:
+        assert batches == [distinct]
+        assert per_row == []
+    else:
+        assert batches == []
+        assert len(per_row) == 4
+    expected = REDACT_PRONOUN_REPLACEMENT + ' ' + REDACT_NAME_REPLACEMENT
+    assert list(clean[2]) == [expected, 'Impedance check', '+0.5', expected, 'Impedance check']
+    assert len(review_events) == 2
+
+
 def test_deidentify_edf():
     # integration test
     from clean_eeg.clean_subject_eeg import deidentify_edf
@@ -104,8 +299,9 @@ def test_deidentify_edf():
     new_annotations = new_data['annotations']
     assert new_annotations[2][2] == REDACT_PRONOUN_REPLACEMENT + ' ' + REDACT_NAME_REPLACEMENT
 
+@pytest.mark.parametrize("mode", ["serial", "prefetch", "workers"])
 @pytest.mark.parametrize("inplace", [False, True])
-def test_clean_subject_edf_files(monkeypatch, inplace):
+def test_clean_subject_edf_files(monkeypatch, inplace, mode):
     # One "y" for the recording-gap prompt (the test subject data has
     # a ~59-minute gap between the two files, above the 60 s threshold).
     # The transfer prompt is short-circuited via auto_transfer_response.
@@ -132,6 +328,8 @@ def test_clean_subject_edf_files(monkeypatch, inplace):
                             input_path=str(TEST_SUBJECT_DATA_DIR) if not inplace else str(output_path),
                             output_path=str(output_path),
                             inplace=inplace,
+                            prefetch=mode == "prefetch",
+                            num_workers=2 if mode == "workers" else 1,
                             auto_transfer_response="n")
     
     # check that file was created
@@ -256,12 +454,40 @@ def test_name_consistency_mismatch_user_denies(monkeypatch):
         _check_subject_name_consistency(meta, command_line_subject_name=cli_name)
 
 
+def test_name_consistency_groups_files_by_name(monkeypatch, capsys):
+    """Multiple header names — each name is listed once with all its files."""
+    monkeypatch.setattr("builtins.input", lambda _: 'yes')
+    meta = _make_edf_meta({'a.edf': 'Jane Smith', 'b.edf': 'X', 'c.edf': 'Jane Smith'})
+    _check_subject_name_consistency(meta, command_line_subject_name=None)
+    out = capsys.readouterr().out
+    assert "Subject name \"Jane Smith\" found in files: ['a.edf', 'c.edf']" in out
+    assert "Subject name \"X\" found in files: ['b.edf']" in out
+
+
 def test_name_consistency_no_cli_name():
     """No CLI name provided — should pass without prompting regardless of header name."""
     meta = _make_edf_meta({'file1.edf': 'Jane Smith'})
     _check_subject_name_consistency(meta, command_line_subject_name=None)
 
 
+def test_recording_gaps_flags_inconsistent_durations_only(capsys):
+    """Only the file whose header duration disagrees with
+    record_duration * n_records gets the per-file warning."""
+    from clean_eeg.clean_subject_eeg import _check_recording_gaps
+    start = datetime(2020, 1, 1)
+    meta = {
+        'a.edf': {'data': {'header': {'startdate': start, 'record_duration': 1.0,
+                                      'n_records': 10, 'file_duration': 10}}},
+        'b.edf': {'data': {'header': {'startdate': start + timedelta(seconds=10), 'record_duration': 1.0,
+                                      'n_records': 10, 'file_duration': 12}}},
+    }
+    _check_recording_gaps(meta)
+    out = capsys.readouterr().out
+    assert "EDF file b.edf has inconsistent file duration" in out
+    assert "a.edf has inconsistent" not in out
+    assert "Gap of" not in out and "Overlap of" not in out
+
+
 def test_clean_subject_edf_files_empty_dir_raises(tmp_path):
     """An input directory with no .edf files should raise RuntimeError with a
     helpful message rather than crashing in min() on an empty sequence."""
@@ -484,6 +710,33 @@ def test_pipeline_skips_file_with_non_ascii_label_gracefully(tmp_path,
         "operator must be directed to send log.out to data team"
 
 
+def test_parallel_metadata_load_matches_serial(tmp_path, capsys):
+    """load_workers > 1 must yield the same meta-data, in the same order,
+    and report failed files the same way as the serial loader."""
+    from clean_eeg.clean_subject_eeg import _load_edf_metadata
+
+    for i in range(3):
+        _write_minimal_edfplus_with_annotations(str(tmp_path / f"f{i}.edf"),
+                                                 n_channels=2,
+                                                 sample_rate=100,
+                                                 duration_s=2)
+    with open(tmp_path / "f1.edf", "r+b") as f:
+        f.seek(256)
+        f.write(b"\xff")  # non-ASCII label byte -> pyedflib rejects the file
+
+    serial = _load_edf_metadata(str(tmp_path), load_workers=1)
+    serial_out = capsys.readouterr().out
+    parallel = _load_edf_metadata(str(tmp_path), load_workers=2)
+    parallel_out = capsys.readouterr().out
+
+    assert list(parallel) == list(serial) == ["f0.edf", "f2.edf"]
+    for fn in serial:
+        assert parallel[fn]['data']['header'] == serial[fn]['data']['header']
+        assert parallel[fn]['data']['signal_headers'] == serial[fn]['data']['signal_headers']
+    assert "Failed to load EDF file f1.edf" in parallel_out
+    assert "- f1.edf:" in parallel_out and "- f1.edf:" in serial_out
+
+
 def test_audit_runs_on_every_file_with_pyedflib_cross_check(monkeypatch,
                                                               tmp_path,
                                                               capsys):
@@ -630,6 +883,71 @@ def test_audit_pyedflib_cross_check_raises_when_orig_disagrees(tmp_path):
                                 inplace=True, digital=True)
 
 
+def test_worker_pool_failure_is_quarantined_in_order(monkeypatch, tmp_path, capsys):
+    """num_workers > 1: a file failing inside a worker is reported and
+    quarantined by the parent exactly like the serial path, while the
+    other files are still cleaned."""
+    monkeypatch.setattr("builtins.input", lambda _: "y")
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    for name in ("a.edf", "b.edf", "c.edf"):
+        _write_minimal_edfplus_with_annotations(str(input_dir / name),
+                                                 n_channels=2,
+                                                 sample_rate=100,
+                                                 duration_s=2)
+
+    import clean_eeg.clean_subject_eeg as _csm
+    real_audit = _csm._audit_signal_integrity
+
+    def fail_on_b(orig_signals, clean_file_path, filename, **kwargs):
+        print(f"auditing {filename}", file=sys.stderr)
+        if filename == "b.edf":
+            raise RuntimeError("AUDIT FAILURE for test (synthetic)")
+        return real_audit(orig_signals, clean_file_path, filename, **kwargs)
+
+    # Pin the fork start method so the workers inherit the patched module
+    # attribute (forkserver/spawn — the 3.14+ Linux and macOS/Windows
+    # defaults — would re-import the unpatched module).
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("needs the fork start method")
+    monkeypatch.setattr(_csm, "_audit_signal_integrity", fail_on_b)
+    # the parent must not build a redactor of its own; workers build theirs
+    parent_redactors = []
+    real_redactor_cls = _csm.SubjectNameRedactor
+
+    def counting_redactor(*args, **kwargs):
+        parent_redactors.append(os.getpid())
+        return real_redactor_cls(*args, **kwargs)
+    monkeypatch.setattr(_csm, "SubjectNameRedactor", counting_redactor)
+    parent_pid = os.getpid()
+
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    clean_subject_edf_files(
+        input_path=str(input_dir),
+        output_path=str(output_dir),
+        subject_code=SUBJECT_CODE,
+        subject_name=PATIENT_NAME,
+        inplace=False,
+        num_workers=2,
+        mp_context=multiprocessing.get_context("fork"),
+        auto_transfer_response="n",
+    )
+
+    captured = capsys.readouterr()
+    out = captured.out
+    # worker stderr is handed back and replayed by the parent in file order
+    assert re.findall(r"auditing \w\.edf", captured.err) == \
+        ["auditing a.edf", "auditing b.edf", "auditing c.edf"]
+    assert "Failed to de-identify EDF file b.edf" in out
+    assert "AUDIT FAILURE for test (synthetic)" in out
+    cleaned = sorted(f.split("_")[0] for f in os.listdir(output_dir)
+                     if f.endswith(".edf"))
+    assert cleaned == ["a", "c"]
+    assert os.listdir(output_dir / "quarantine")
+    assert parent_pid not in parent_redactors
+
+
 def test_failed_file_is_quarantined_not_left_in_output_dir(monkeypatch,
                                                               tmp_path,
                                                               capsys):
@@ -881,6 +1199,14 @@ def test_audit_skipped_when_skip_audit_true(monkeypatch, tmp_path, capsys):
         return real_audit(*args, **kwargs)
 
     monkeypatch.setattr(_csm, "_audit_signal_integrity", counting_audit)
+    load_calls = []
+    real_load_edf = _csm.load_edf
+
+    def counting_load_edf(path, *args, **kwargs):
+        load_calls.append(os.path.basename(path))
+        return real_load_edf(path, *args, **kwargs)
+
+    monkeypatch.setattr(_csm, "load_edf", counting_load_edf)
 
     clean_subject_edf_files(
         input_path=str(input_dir),
@@ -893,6 +1219,9 @@ def test_audit_skipped_when_skip_audit_true(monkeypatch, tmp_path, capsys):
         auto_transfer_response="n",
     )
 
+    # no signals needed: the meta-data pass's load is reused, not repeated
+    assert sorted(load_calls) == ["f0.edf", "f1.edf"]
+
     assert audit_calls["n"] == 0, (
         f"skip_audit=True must skip _audit_signal_integrity entirely, "
         f"got {audit_calls['n']} call(s)"
@@ -1620,6 +1949,29 @@ def test_recursive_flat_input_unchanged(monkeypatch, tmp_path):
     assert len(mains) == 2, f"expected 2 cleaned EDFs at output root, got {mains}"
 
 
+def test_scan_edf_files_recursive_matches_rglob(tmp_path):
+    """The scandir walk must find the same files as the Path.rglob scan it
+    replaced: case-insensitive suffix, files only, symlinked dirs skipped."""
+    from pathlib import Path
+    from clean_eeg.clean_subject_eeg import _scan_edf_files_recursive
+
+    for rel in ["a.edf", "B.EDF", "notes.txt", "s1/c.edf", "s1/deep/d.Edf",
+                "s2/e.edf.bak", ".hidden/f.edf"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+    (tmp_path / "dir.edf").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "s1", target_is_directory=True)
+
+    expected = sorted(
+        str(p.relative_to(tmp_path)).replace(os.sep, "/")
+        for p in Path(tmp_path).rglob("*")
+        if p.suffix.lower() == ".edf" and p.is_file()
+    )
+    assert sorted(_scan_edf_files_recursive(str(tmp_path))) == expected
+    assert "s1/deep/d.Edf" in expected and "link/c.edf" not in expected
+
+
 def test_recording_gaps_bypassed_by_approve_confirmations(monkeypatch, tmp_path, capsys):
     """Positive bypass: --approve-confirmations recording-gaps skips the
     interactive prompt. Uses a monkeypatched input that raises so the
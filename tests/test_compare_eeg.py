@@ -0,0 +1,113 @@
+import json
+import numpy as np
+import pyedflib
+
+from clean_eeg.compare_eeg import compare_edf_files, compare_pyedflib_signal_headers, compare_pyedflib_signals
+from clean_eeg.load_eeg import load_edf
+from clean_eeg.paths import TEST_DATA_DIR, TEST_CONFIG_FILE
+
+with open(TEST_CONFIG_FILE, 'r') as f:
+    TEST_CONFIG = json.load(f)
+BASIC_EDFC = str(TEST_DATA_DIR / TEST_CONFIG["basic_EDF+C"]['filename'])
+
+
+def test_compare_signals_equal():
+    signals = np.arange(12, dtype=np.int32).reshape(3, 4)
+    assert compare_pyedflib_signals(signals, signals.copy())
+
+
+def test_compare_signals_differ_reports_stats(capsys):
+    signals1 = np.zeros((4, 5), dtype=np.int32)
+    signals2 = signals1.copy()
+    signals2[1, 2] = 7
+    assert not compare_pyedflib_signals(signals1, signals2, verbosity=1)
+    out = capsys.readouterr().out
+    assert 'Proportion of values different: 0.05' in out
+    assert 'Proportion of channels different: 0.25' in out
+
+
+def test_compare_signals_initial_values_only():
+    signals1 = np.ones((2, 6), dtype=np.int32)
+    signals2 = np.ones((2, 4), dtype=np.int32)
+    assert compare_pyedflib_signals(signals1, signals2)
+    assert not compare_pyedflib_signals(signals1, signals2, match_initial_values_only=False)
+
+
+def _signal_header(label, physical_min=-100.0, physical_max=100.0):
+    return {'label': label, 'dimension': 'uV',
+            'physical_min': physical_min, 'physical_max': physical_max}
+
+
+def test_compare_signal_headers_physical_range_tolerance():
+    headers1 = [_signal_header('C3'), _signal_header('C4')]
+    headers2 = [_signal_header('C3', physical_max=100.05), _signal_header('C4')]
+    assert compare_pyedflib_signal_headers(headers1, headers2, physical_range_rel_tol=1e-3)
+    assert not compare_pyedflib_signal_headers(headers1, headers2, physical_range_rel_tol=1e-5)
+
+
+def test_compare_signal_headers_checks_every_channel_pair():
+    # a mismatch in a non-range field of any channel (not just the last)
+    # must be reported when a physical range tolerance is in effect
+    headers1 = [_signal_header('C3'), _signal_header('C4')]
+    headers2 = [_signal_header('Fp1'), _signal_header('C4')]
+    assert not compare_pyedflib_signal_headers(headers1, headers2, physical_range_rel_tol=1e-3)
+    assert compare_pyedflib_signal_headers(headers1, [dict(sh) for sh in headers1],
+                                           physical_range_rel_tol=1e-3)
+
+
+def test_compare_signal_headers_missing_range_key():
+    headers1 = [_signal_header('C3')]
+    headers2 = [{k: v for k, v in _signal_header('C3').items() if k != 'physical_min'}]
+    assert not compare_pyedflib_signal_headers(headers1, headers2, physical_range_rel_tol=1e-3)
+
+
+def _write_copy(src, dst, modify_signals=None):
+    data = load_edf(src, load_method='pyedflib', preload=True, read_digital=True)
+    signals = data['signals']
+    if modify_signals is not None:
+        modify_signals(signals)
+    with pyedflib.EdfWriter(dst, len(signals), file_type=pyedflib.FILETYPE_EDFPLUS) as f:
+        f.setSignalHeaders(data['signal_headers'])
+        f.setHeader(data['header'])
+        f.writeSamples(signals, digital=True)
+        for time, duration, text in zip(*data['annotations']):
+            f.writeAnnotation(time, duration, text)
+
+
+def test_compare_edf_files_streamed(tmp_path):
+    same = str(tmp_path / 'same.edf')
+    changed = str(tmp_path / 'changed.edf')
+    _write_copy(BASIC_EDFC, same)
+
+    def bump_last_channel(signals):
+        signals[-1][0] += 1
+    _write_copy(BASIC_EDFC, changed, modify_signals=bump_last_channel)
+
+    for stream in (False, True):
+        assert compare_edf_files(BASIC_EDFC, same, stream=stream)
+        assert not compare_edf_files(BASIC_EDFC, changed, stream=stream)
+
+
+def test_compare_annotations(capsys):
+    from clean_eeg.compare_eeg import compare_pyedflib_annotations
+    annotations = (np.array([0.0, 1.5, 3.0]), np.array([-1.0, 0.5, -1.0]),
+                   np.array(['start', 'spike', 'end']))
+    assert compare_pyedflib_annotations(annotations, tuple(a.copy() for a in annotations))
+
+    changed = (annotations[0], annotations[1], np.array(['start', 'X', 'end']))
+    assert not compare_pyedflib_annotations(annotations, changed, verbosity=1)
+    out = capsys.readouterr().out
+    assert out.count('Annotations differ') == 1 and "'spike'" in out
+
+    shorter = tuple(a[:2] for a in annotations)
+    assert not compare_pyedflib_annotations(annotations, shorter)
+
+
+def test_compare_signals_multirate_channels():
+    # pyedflib returns one array per channel; channels may differ in length
+    signals1 = [np.arange(8, dtype=np.int32), np.arange(4, dtype=np.int32)]
+    signals2 = [np.arange(8, dtype=np.int32), np.arange(4, dtype=np.int32)]
+    assert compare_pyedflib_signals(signals1, signals2)
+    signals2[1] = np.array([0, 1, 2, 9], dtype=np.int32)
+    assert not compare_pyedflib_signals(signals1, signals2)
+    assert not compare_pyedflib_signals(signals1, signals2[:1])
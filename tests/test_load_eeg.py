@@ -43,6 +43,15 @@ def test_is_edf_format():
     assert not load_eeg.is_edf_continuous(BASIC_EDFD)
 
 
+def test_get_edf_reserved_field_without_pread(monkeypatch):
+    """The lseek + read fallback (platforms without os.pread) reads the
+    same 44 bytes as the pread path."""
+    expected = load_eeg.get_edf_reserved_field(BASIC_EDFC)
+    assert expected.startswith('EDF+C') and len(expected) == 44
+    monkeypatch.delattr(load_eeg.os, 'pread', raising=False)
+    assert load_eeg.get_edf_reserved_field(BASIC_EDFC) == expected
+
+
 def test_load_edf_discontinuous_lunapi():
     data = load_edf(CONTINUOUS_EDFD_FILE, load_method='lunapi', preload=True)
     import lunapi as lp
@@ -72,6 +72,24 @@ def test_phi_scrub_case_insensitive(tmp_path):
     assert content.count("[PHI_REDACTED]") == 3
 
 
+def test_phi_scrub_overlapping_parts(tmp_path):
+    """Name parts that are prefixes of one another are all scrubbed, each
+    only as a whole word."""
+    log_path = str(tmp_path / "log.out")
+    logger = PipelineLogger(log_path)
+    logger.add_phi("Mark")
+    logger.add_phi("Markus")
+    logger.add_phi("Lee")
+    try:
+        print("Markus met Mark Lee; Marks and Leeway untouched")
+    finally:
+        logger.close()
+
+    content = open(log_path).read()
+    assert "[PHI_REDACTED] met [PHI_REDACTED] [PHI_REDACTED];" in content
+    assert "Marks and Leeway untouched" in content
+
+
 def test_rescrub_retroactive(tmp_path):
     """rescrub() should scrub PHI from log entries written before the pattern was registered."""
     log_path = str(tmp_path / "log.out")